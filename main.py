@@ -31,24 +31,62 @@ API docs: https://www.instapaper.com/api
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import queue
+import random
+import signal
 import stat
 import sys
-import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from requests_oauthlib import OAuth1
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 API_BASE = "https://www.instapaper.com/api/1"
 CFG_DIR = Path(os.path.expanduser("~/.config/instapaper-cli"))
 CRED_PATH = CFG_DIR / "credentials.json"
 RULES_PATH = CFG_DIR / "rules.json"
 
+RETRY_STATUS = (429, 500, 502, 503, 504)
+MAX_ATTEMPTS = 6
+MAX_BACKOFF = 30.0
+# worker threads sharing the session; its pool holds one connection each
+PREFETCH_WORKERS = 1
+MOVE_WORKERS = 4
+# bookmark ids sent back as "have" so the server skips items already shown
+MAX_SEEN = 500
+
+# set on Ctrl-C, or on exit once moves have drained; aborts backoff sleeps
+# and API calls still queued in workers
+_QUIT = threading.Event()
+
+# bookmark ids whose queued move was dropped because of _QUIT
+_UNSENT_MOVES: List[int] = []
+
+# set once CFG_DIR has been created by this process
+_CFG_DIR_READY = False
+
+# parsed credentials.json, kept for the lifetime of the process
+_CRED_CACHE: Optional[dict] = None
+
+# key holding the folder id at a terminal node of the suffix trie
+_TRIE_FOLDER = "#folder"
+
 
 @dataclass
 class Folder:
@@ -56,6 +94,14 @@ class Folder:
     title: str
 
 
+@dataclass
+class Bookmark:
+    bookmark_id: int
+    title: str
+    url: str
+    domain: str
+
+
 def require_env(name: str) -> str:
     v = os.getenv(name)
     if not v:
@@ -75,22 +121,66 @@ def ensure_private_file(path: Path) -> None:
 
 
 def load_json(path: Path, default):
-    if not path.exists():
+    try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
         return default
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
 
 
 def save_json(path: Path, data) -> None:
-    CFG_DIR.mkdir(parents=True, exist_ok=True)
+    global _CFG_DIR_READY
+    if not _CFG_DIR_READY:
+        CFG_DIR.mkdir(parents=True, exist_ok=True)
+        _CFG_DIR_READY = True
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    try:
+        tmp.unlink()  # leftover from an interrupted save
+    except FileNotFoundError:
+        pass
+    # create as 600 up front so the file is never readable by others
+    fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_TRUNC, 0o600)
+    if orjson is not None:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+    else:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     tmp.replace(path)
-    ensure_private_file(path)
+    if os.name == "nt":
+        # the mode passed to os.open is largely ignored on Windows
+        ensure_private_file(path)
+
+
+def make_session() -> requests.Session:
+    """
+    Create a Session that keeps one TLS connection alive across API calls.
+    Transport-level retries are disabled; api_post owns the backoff logic.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=PREFETCH_WORKERS + MOVE_WORKERS,
+        max_retries=Retry(total=0),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=8)
+def consumer_oauth(consumer_key: str, consumer_secret: str) -> OAuth1:
+    """
+    OAuth1 signer with consumer credentials only, as used by xAuth.
+    """
+    return OAuth1(consumer_key, consumer_secret)
 
 
 def oauth_access_token_xauth(
+    session: requests.Session,
     consumer_key: str,
     consumer_secret: str,
     username: str,
@@ -102,9 +192,9 @@ def oauth_access_token_xauth(
     Returns: oauth_token, oauth_token_secret
     """
     url = f"{API_BASE}/oauth/access_token"
-    auth = OAuth1(consumer_key, consumer_secret)  # request signed by consumer only
+    auth = consumer_oauth(consumer_key, consumer_secret)
 
-    r = requests.post(
+    r = session.post(
         url,
         auth=auth,
         data={
@@ -117,31 +207,59 @@ def oauth_access_token_xauth(
     r.raise_for_status()
 
     # response: oauth_token=...&oauth_token_secret=...
-    parts = dict(kv.split("=", 1) for kv in r.text.strip().split("&"))
-    return parts["oauth_token"], parts["oauth_token_secret"]
+    parts = parse_qs(r.text.strip())
+    return parts["oauth_token"][0], parts["oauth_token_secret"][0]
+
+
+def backoff_delay(attempt: int, r: Optional[requests.Response] = None) -> float:
+    """
+    Full-jitter exponential backoff, raised to the server's Retry-After on 429.
+    """
+    delay = random.uniform(0, 0.6 * (2**attempt))
+    if r is not None and r.status_code == 429:
+        try:
+            delay = max(delay, float(r.headers.get("Retry-After", "")))
+        except ValueError:
+            # missing, or an HTTP-date we don't bother parsing
+            pass
+    return min(delay, MAX_BACKOFF)
 
 
-def api_post(auth: OAuth1, path: str, data: Optional[dict] = None) -> dict:
+def api_post(
+    session: requests.Session, auth: OAuth1, path: str, data: Optional[dict] = None
+) -> dict:
     url = f"{API_BASE}{path}"
     payload = data or {}
-
-    last_err: Optional[Exception] = None
-    for attempt in range(6):
+    if _QUIT.is_set():
+        raise SystemExit(f"API request cancelled: {path}")
+
+    # network errors and retryable HTTP statuses back off independently
+    err_attempt = 0
+    status_attempt = 0
+    last_err: object = None
+    while err_attempt < MAX_ATTEMPTS and status_attempt < MAX_ATTEMPTS:
         try:
-            r = requests.post(url, auth=auth, data=payload, timeout=30)
-            if r.status_code in (429, 500, 502, 503, 504):
-                time.sleep(0.6 * (2**attempt))
+            r = session.post(url, auth=auth, data=payload, timeout=30)
+            if r.status_code in RETRY_STATUS:
+                last_err = f"HTTP {r.status_code}"
+                if _QUIT.wait(backoff_delay(status_attempt, r)):
+                    break
+                status_attempt += 1
                 continue
             r.raise_for_status()
             return r.json() if r.text else {}
         except Exception as e:
             last_err = e
-            time.sleep(0.6 * (2**attempt))
+            if _QUIT.wait(backoff_delay(err_attempt)):
+                break
+            err_attempt += 1
+    if _QUIT.is_set():
+        raise SystemExit(f"API request cancelled: {path}")
     raise SystemExit(f"API request failed: {path}: {last_err}")
 
 
-def list_folders(auth: OAuth1) -> List[Folder]:
-    raw = api_post(auth, "/folders/list", {})
+def list_folders(session: requests.Session, auth: OAuth1) -> List[Folder]:
+    raw = api_post(session, auth, "/folders/list", {})
     out: List[Folder] = []
     for x in raw:
         if x.get("type") == "folder":
@@ -149,21 +267,109 @@ def list_folders(auth: OAuth1) -> List[Folder]:
     return out
 
 
-def list_unread_bookmarks(auth: OAuth1, limit: int = 25) -> List[dict]:
-    res = api_post(
-        auth, "/bookmarks/list", {"folder_id": "unread", "limit": str(limit)}
-    )
-    return res.get("bookmarks", [])
+def list_unread_bookmarks(
+    session: requests.Session,
+    auth: OAuth1,
+    limit: int = 25,
+    have: Iterable[int] = (),
+) -> List[Bookmark]:
+    data = {"folder_id": "unread", "limit": str(limit)}
+    have_ids = ",".join(map(str, have))
+    if have_ids:
+        data["have"] = have_ids
+    res = api_post(session, auth, "/bookmarks/list", data)
+    out: List[Bookmark] = []
+    # the list also contains "user" and "meta" objects
+    for x in res.get("bookmarks", []):
+        if x.get("type") == "bookmark":
+            url = (x.get("url") or "").strip()
+            out.append(
+                Bookmark(
+                    bookmark_id=int(x["bookmark_id"]),
+                    title=(x.get("title") or "").strip() or "(no title)",
+                    url=url,
+                    domain=domain_of(url),
+                )
+            )
+    return out
 
 
-def move_bookmark(auth: OAuth1, bookmark_id: int, folder_id: int) -> None:
+def move_bookmark(
+    session: requests.Session, auth: OAuth1, bookmark_id: int, folder_id: int
+) -> None:
     api_post(
+        session,
         auth,
         "/bookmarks/move",
         {"bookmark_id": str(bookmark_id), "folder_id": str(folder_id)},
     )
 
 
+def report_move_failure(bookmark_id: int, future: Future) -> None:
+    """
+    Done-callback for background moves: print the error, if any.
+    Moves dropped after Ctrl-C are only counted; main() reports them.
+    """
+    if future.cancelled():
+        _UNSENT_MOVES.append(bookmark_id)
+        return
+    err = future.exception()
+    if err is None:
+        return
+    if _QUIT.is_set():
+        _UNSENT_MOVES.append(bookmark_id)
+        return
+    print(f"\n  move failed [{bookmark_id}]: {err}")
+
+
+def learn_on_success(
+    learned: queue.SimpleQueue, domain: str, folder_id: int, future: Future
+) -> None:
+    """
+    Done-callback for background moves: queue (domain, folder_id) for
+    lightweight learning once the move has gone through.
+    """
+    if not future.cancelled() and future.exception() is None:
+        learned.put((domain, folder_id))
+
+
+def merge_learned(learned: queue.SimpleQueue, rules: Dict[str, int]) -> bool:
+    """
+    Add rules learned from finished moves; returns True if any was new.
+    Existing rules are never overwritten.
+    """
+    changed = False
+    while True:
+        try:
+            domain, folder_id = learned.get_nowait()
+        except queue.Empty:
+            return changed
+        if domain not in rules:
+            rules[domain] = folder_id
+            changed = True
+
+
+def drain(futures: List[Future]) -> None:
+    """
+    Wait for background calls to finish. Once _QUIT is set (see
+    handle_sigint), queued calls are cancelled and running ones stop retrying,
+    so the wait only lasts for requests already in flight.
+    """
+    # waiting on the futures rather than joining worker threads: an
+    # interrupted Thread.join() can leave the thread marked as stopped
+    while True:
+        if _QUIT.is_set():
+            # calls that have not started yet are dropped outright
+            for f in futures:
+                f.cancel()
+        try:
+            wait(futures)
+            return
+        except KeyboardInterrupt:
+            pass
+
+
+@lru_cache(maxsize=4096)
 def domain_of(url: str) -> str:
     try:
         return urlparse(url).netloc.lower()
@@ -171,22 +377,64 @@ def domain_of(url: str) -> str:
         return ""
 
 
-def suggest_folder(domain: str, rules: Dict[str, int]) -> Optional[int]:
+def _build_trie(rules: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Index suffix rules (".example.com") by reversed labels: com -> example.
+    """
+    root: Dict[str, Any] = {}
+    for k, v in rules.items():
+        if not k.startswith("."):
+            continue
+        node = root
+        for label in k[1:].split(".")[::-1]:
+            node = node.setdefault(label, {})
+        node[_TRIE_FOLDER] = v
+    return root
+
+
+def suggest_folder(
+    domain: str, rules: Dict[str, int], suffix_trie: Dict[str, Any]
+) -> Optional[int]:
     if domain in rules:
         return rules[domain]
-    # allow suffix rules: ".example.com"
-    for k, v in rules.items():
-        if k.startswith(".") and domain.endswith(k):
-            return v
-    return None
+    # allow suffix rules: ".example.com"; the longest matching suffix wins
+    labels = domain.split(".")[::-1]
+    found: Optional[int] = None
+    node = suffix_trie
+    # the last label must remain unmatched: ".example.com" != "example.com"
+    for label in labels[:-1]:
+        node = node.get(label)
+        if node is None:
+            break
+        if _TRIE_FOLDER in node:
+            found = node[_TRIE_FOLDER]
+    return found
 
 
-def ensure_credentials(consumer_key: str, consumer_secret: str) -> Tuple[str, str]:
+def ensure_credentials(
+    session: requests.Session, consumer_key: str, consumer_secret: str
+) -> Tuple[str, str]:
     """
     Load cached (token, secret), otherwise perform xAuth once and cache.
+    Tokens saved under a different consumer key are discarded.
     """
-    cred = load_json(CRED_PATH, default=None)
-    if cred and "oauth_token" in cred and "oauth_token_secret" in cred:
+    global _CRED_CACHE
+    key_sha = hashlib.sha256(consumer_key.encode()).hexdigest()
+
+    cred = _CRED_CACHE
+    if cred is None:
+        cred = load_json(CRED_PATH, default=None)
+    if (
+        cred
+        and "oauth_token" in cred
+        and "oauth_token_secret" in cred
+        # files written before the fingerprint was added are trusted once
+        and cred.get("consumer_key_sha", key_sha) == key_sha
+    ):
+        if "consumer_key_sha" not in cred:
+            cred = dict(cred, consumer_key_sha=key_sha)
+            save_json(CRED_PATH, cred)
+        _CRED_CACHE = cred
         return cred["oauth_token"], cred["oauth_token_secret"]
 
     username = os.getenv("INSTAPAPER_USERNAME")
@@ -197,9 +445,15 @@ def ensure_credentials(consumer_key: str, consumer_secret: str) -> Tuple[str, st
         )
 
     token, secret = oauth_access_token_xauth(
-        consumer_key, consumer_secret, username, password
+        session, consumer_key, consumer_secret, username, password
     )
-    save_json(CRED_PATH, {"oauth_token": token, "oauth_token_secret": secret})
+    cred = {
+        "oauth_token": token,
+        "oauth_token_secret": secret,
+        "consumer_key_sha": key_sha,
+    }
+    save_json(CRED_PATH, cred)
+    _CRED_CACHE = cred
     return token, secret
 
 
@@ -207,26 +461,24 @@ def build_keymap(folders: List[Folder], max_keys: int = 9) -> Dict[str, Folder]:
     return {str(i + 1): folders[i] for i in range(min(max_keys, len(folders)))}
 
 
-def pick_folder_name(folders: List[Folder], folder_id: int) -> Optional[str]:
-    for f in folders:
-        if f.folder_id == folder_id:
-            return f.title
-    return None
-
-
-def main() -> None:
-    consumer_key = require_env("INSTAPAPER_CONSUMER_KEY")
-    consumer_secret = require_env("INSTAPAPER_CONSUMER_SECRET")
-
-    token, secret = ensure_credentials(consumer_key, consumer_secret)
+def run(
+    session: requests.Session,
+    prefetcher: ThreadPoolExecutor,
+    mover: ThreadPoolExecutor,
+    consumer_key: str,
+    consumer_secret: str,
+) -> None:
+    token, secret = ensure_credentials(session, consumer_key, consumer_secret)
     auth = OAuth1(consumer_key, consumer_secret, token, secret)
 
-    folders = list_folders(auth)
+    folders = list_folders(session, auth)
     if not folders:
         raise SystemExit("No user-created folders. Create folders in Instapaper first.")
+    folder_titles = {f.folder_id: f.title for f in folders}
 
     keymap = build_keymap(folders, max_keys=9)
     rules: Dict[str, int] = load_json(RULES_PATH, default={})
+    suffix_trie = _build_trie(rules)
 
     print("Folders (1..9):")
     for k, f in keymap.items():
@@ -235,81 +487,149 @@ def main() -> None:
         "\nControls: [1-9]=move  [a]=auto(move by rule)  [s]=save rule for domain  [n]=skip  [q]=quit\n"
     )
 
-    while True:
-        bookmarks = list_unread_bookmarks(auth, limit=25)
-        # bookmarks includes "meta" objects too; filter below
-        items = [b for b in bookmarks if b.get("type") == "bookmark"]
-
-        if not items:
-            print("No unread bookmarks.")
-            break
-
-        for b in items:
-            bid = int(b["bookmark_id"])
-            title = (b.get("title") or "").strip() or "(no title)"
-            url = (b.get("url") or "").strip()
-            dom = domain_of(url)
-
-            suggested_id = suggest_folder(dom, rules) if dom else None
-            sug_name = pick_folder_name(folders, suggested_id) if suggested_id else None
-
-            print(f"[{bid}] {title}")
-            print(f"  {dom or url}")
-            if sug_name:
-                print(f"  suggestion: {sug_name}")
-
-            cmd = input("> ").strip().lower()
-
-            if cmd == "q":
-                save_json(RULES_PATH, rules)
-                return
-
-            if cmd in ("n", ""):
-                print()
-                continue
+    # next batch, fetched in the background while the last item is on screen
+    future: Optional[Future] = None
+    # ids shown this session, oldest dropped first
+    seen: Deque[int] = deque(maxlen=MAX_SEEN)
+    # (domain, folder_id) of successful moves, filled from mover threads
+    learned: queue.SimpleQueue = queue.SimpleQueue()
+    # background moves that may not have finished yet
+    moves: List[Future] = []
+
+    # rules are written once on the way out, and only if something changed;
+    # the finally also covers Ctrl-C and fatal API errors
+    rules_dirty = False
+    try:
+        while True:
+            if future is not None:
+                items = future.result()
+            else:
+                items = list_unread_bookmarks(session, auth, limit=25)
+            future = None
+            seen.extend(b.bookmark_id for b in items)
+
+            if not items:
+                print("No more unread bookmarks.")
+                break
+
+            for i, b in enumerate(items):
+                if merge_learned(learned, rules):
+                    rules_dirty = True
+                suggested_id = (
+                    suggest_folder(b.domain, rules, suffix_trie) if b.domain else None
+                )
+                sug_name = folder_titles.get(suggested_id) if suggested_id else None
+
+                print(f"[{b.bookmark_id}] {b.title}")
+                print(f"  {b.domain or b.url}")
+                if sug_name:
+                    print(f"  suggestion: {sug_name}")
+
+                if i == len(items) - 1:
+                    future = prefetcher.submit(
+                        list_unread_bookmarks, session, auth, 25, list(seen)
+                    )
+
+                cmd = input("> ").strip().lower()
+
+                if cmd == "q":
+                    return
+
+                if cmd in ("n", ""):
+                    print()
+                    continue
 
-            if cmd == "a":
-                if not suggested_id:
-                    print("  no suggestion\n")
+                if cmd == "a":
+                    if not suggested_id:
+                        print("  no suggestion\n")
+                        continue
+                    fut = mover.submit(
+                        move_bookmark, session, auth, b.bookmark_id, suggested_id
+                    )
+                    moves = [m for m in moves if not m.done()] + [fut]
+                    fut.add_done_callback(partial(report_move_failure, b.bookmark_id))
+                    print(f"  moving -> {sug_name}\n")
                     continue
-                try:
-                    move_bookmark(auth, bid, suggested_id)
-                    print(f"  moved -> {sug_name}\n")
-                except Exception as e:
-                    print(f"  move failed: {e}\n")
-                continue
 
-            if cmd == "s":
-                if not dom:
-                    print("  no domain; cannot save rule\n")
+                if cmd == "s":
+                    if not b.domain:
+                        print("  no domain; cannot save rule\n")
+                        continue
+                    print("Pick folder key to bind this domain to:")
+                    for k, f in keymap.items():
+                        print(f"  {k}: {f.title}")
+                    k = input("folder key> ").strip()
+                    if k not in keymap:
+                        print("  invalid key\n")
+                        continue
+                    if rules.get(b.domain) != keymap[k].folder_id:
+                        rules[b.domain] = keymap[k].folder_id
+                        rules_dirty = True
+                    print(f"  saved: {b.domain} -> {keymap[k].title}\n")
                     continue
-                print("Pick folder key to bind this domain to:")
-                for k, f in keymap.items():
-                    print(f"  {k}: {f.title}")
-                k = input("folder key> ").strip()
-                if k not in keymap:
-                    print("  invalid key\n")
+
+                if cmd in keymap:
+                    folder = keymap[cmd]
+                    fut = mover.submit(
+                        move_bookmark, session, auth, b.bookmark_id, folder.folder_id
+                    )
+                    moves = [m for m in moves if not m.done()] + [fut]
+                    fut.add_done_callback(partial(report_move_failure, b.bookmark_id))
+                    if b.domain and b.domain not in rules:
+                        # lightweight learning, once the move succeeds
+                        fut.add_done_callback(
+                            partial(
+                                learn_on_success, learned, b.domain, folder.folder_id
+                            )
+                        )
+                    print(f"  moving -> {folder.title}\n")
                     continue
-                rules[dom] = keymap[k].folder_id
-                save_json(RULES_PATH, rules)
-                print(f"  saved: {dom} -> {keymap[k].title}\n")
-                continue
 
-            if cmd in keymap:
-                try:
-                    move_bookmark(auth, bid, keymap[cmd].folder_id)
-                    if dom:
-                        rules.setdefault(
-                            dom, keymap[cmd].folder_id
-                        )  # lightweight learning
-                    print(f"  moved -> {keymap[cmd].title}\n")
-                except Exception as e:
-                    print(f"  move failed: {e}\n")
-                continue
+                print("  unknown command\n")
+    finally:
+        pending = sum(not m.done() for m in moves)
+        if pending and not _QUIT.is_set():
+            print(f"waiting for {pending} pending moves (Ctrl-C to drop them)")
+        # rules are only learned from moves that finished
+        drain(moves)
+        if merge_learned(learned, rules):
+            rules_dirty = True
+        if rules_dirty:
+            save_json(RULES_PATH, rules)
+        # nothing needs the pending prefetch any more: stop its retries, and
+        # wait for it so it doesn't outlive the session
+        _QUIT.set()
+        if future is not None:
+            drain([future])
+
+
+def handle_sigint(signum, frame) -> None:
+    """
+    Flag workers to stop retrying, then unwind the main thread as usual.
+    """
+    _QUIT.set()
+    raise KeyboardInterrupt
 
-            print("  unknown command\n")
 
-    save_json(RULES_PATH, rules)
+def main() -> None:
+    consumer_key = require_env("INSTAPAPER_CONSUMER_KEY")
+    consumer_secret = require_env("INSTAPAPER_CONSUMER_SECRET")
+
+    session = make_session()
+    prefetcher = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+    mover = ThreadPoolExecutor(max_workers=MOVE_WORKERS)
+    signal.signal(signal.SIGINT, handle_sigint)
+    try:
+        run(session, prefetcher, mover, consumer_key, consumer_secret)
+    except KeyboardInterrupt:
+        print("\ninterrupted")
+    finally:
+        if _UNSENT_MOVES:
+            print(f"  {len(_UNSENT_MOVES)} queued moves not sent")
+        # run() has already waited for its background work
+        prefetcher.shutdown()
+        mover.shutdown()
+        session.close()
 
 
 if __name__ == "__main__":